@@ -22,6 +22,8 @@ Implementation Notes
 
 """
 
+# pylint: disable=too-many-lines
+
 from adafruit_bus_device.i2c_device import I2CDevice
 
 from micropython import const
@@ -29,6 +31,7 @@ from micropython import const
 try:
     import busio
     from typing import Tuple
+    import microcontroller
 except ImportError:
     pass
 
@@ -58,6 +61,20 @@ _AXP192_DCDC3_OUT_VOLTAGE = const(0x27)
 
 _AXP192_LDO23_OUT_VOLTAGE = const(0x28)
 
+# DCDC number: (enable bit, voltage register, voltage register max value)
+_AXP192_DCDCX_REGISTERS = {
+    1: (_AXP192_DCDC13_LDO23_CTRL_DCDC1, _AXP192_DCDC1_OUT_VOLTAGE, 0x7F),
+    2: (_AXP192_DCDC13_LDO23_CTRL_DCDC2, _AXP192_DCDC2_OUT_VOLTAGE, 0x3F),
+    3: (_AXP192_DCDC13_LDO23_CTRL_DCDC3, _AXP192_DCDC3_OUT_VOLTAGE, 0x7F),
+}
+
+# LDO number: (enable bit, voltage value offset in LDO23 voltage register,
+#              mask of the other LDO voltage value)
+_AXP192_LDO23_REGISTERS = {
+    2: (_AXP192_DCDC13_LDO23_CTRL_LDO2, 4, 0x0F),
+    3: (_AXP192_DCDC13_LDO23_CTRL_LDO3, 0, 0xF0),
+}
+
 _AXP192_POWER_OFF_VOLTAGE = const(0x31)
 
 _AXP192_POWER_OFF_BATT_CHGLED_CTRL = const(0x32)
@@ -65,13 +82,26 @@ _AXP192_POWER_OFF_BATT_CHGLED_CTRL_OFF = const(0b10000000)
 
 _AXP192_CHARGING_CTRL1 = const(0x33)
 _AXP192_CHARGING_CTRL1_ENABLE = const(0b10000000)
+_AXP192_CHARGING_CTRL1_TARGET_VOLTAGES = (4.1, 4.15, 4.2, 4.36)
 
 _AXP192_BACKUP_BATT = const(0x35)
 _AXP192_BACKUP_BATT_CHARGING_ENABLE = const(0b10000000)
 
+_AXP192_IRQ_3_ENABLE = const(0x42)
+_AXP192_IRQ_3_ENABLE_PEK = const(0b00000011)  # Power key short and long press
+
+_AXP192_IRQ_1_STATUS = const(0x44)
+_AXP192_IRQ_2_STATUS = const(0x45)
 _AXP192_IRQ_3_STATUS = const(0x46)
 _AXP192_IRQ_3_STATUS_PEK_SHORT_PRESS = const(0b00000010)
 _AXP192_IRQ_3_STATUS_PEK_LONG_PRESS = const(0b00000001)
+_AXP192_IRQ_4_STATUS = const(0x47)
+
+_AXP192_ACIN_VOLTAGE_ADC = const(0x56)
+# ACIN voltage and current, VBUS voltage and current, internal temperature
+_AXP192_ADC_BURST_LENGTH = const(10)
+
+_AXP192_BATTERY_VOLTAGE_ADC = const(0x78)
 
 _AXP192_ADC_ENABLE_1 = const(0x82)
 
@@ -79,14 +109,71 @@ _AXP192_GPIO0_FUNCTION = const(0x90)
 _AXP192_GPIO1_FUNCTION = const(0x92)
 _AXP192_GPIO2_FUNCTION = const(0x93)
 _AXP192_GPIO34_FUNCTION = const(0x95)
+_AXP192_GPIO_FUNCTION_LDO = const(0x02)
+_AXP192_GPIO_FUNCTION_PWM = const(0x02)
+_AXP192_GPIO_FUNCTION_OUTPUT_LOW = const(0x05)
+_AXP192_GPIO_FUNCTION_FLOATING = const(0x07)
+_AXP192_GPIO_FUNCTION_FLOATING_MASK = const(0x06)  # 0x06 and 0x07 are both floating
+
+# GPIO number: (function register, function value offset, function value mask)
+_AXP192_GPIO_FUNCTIONS = (
+    (_AXP192_GPIO0_FUNCTION, 0, 0x07),
+    (_AXP192_GPIO1_FUNCTION, 0, 0x07),
+    (_AXP192_GPIO2_FUNCTION, 0, 0x07),
+    (_AXP192_GPIO34_FUNCTION, 0, 0x03),
+    (_AXP192_GPIO34_FUNCTION, 2, 0x03),
+)
+
+# GPIOs supporting each GPIO mode
+_AXP192_GPIOS_WITH_FLOATING_MODE = (0, 1, 2)
+_AXP192_GPIOS_WITH_LOW_OUTPUT_MODE = (0, 1, 2)
+_AXP192_GPIOS_WITH_LDO_MODE = (0,)
+_AXP192_GPIOS_WITH_PWM_MODE = (1, 2)
 
 _AXP192_GPIO0_LDO_VOLTAGE = const(0x91)
 _AXP192_PWM1_DUTY_RATIO_Y1 = const(0x99)
 _AXP192_PWM2_DUTY_RATIO_Y1 = const(0x9C)
 
+# Registers updated by the AXP192 itself (power status, IRQ status and ADC data).
+# They are always read from the device and never stored in the register cache
+_AXP192_VOLATILE_REGISTERS = (
+    _AXP192_INPUT_POWER_STATE,
+    _AXP192_POWER_CHARGE_STATUS,
+    _AXP192_IRQ_1_STATUS,
+    _AXP192_IRQ_2_STATUS,
+    _AXP192_IRQ_3_STATUS,
+    _AXP192_IRQ_4_STATUS,
+    0x56,
+    0x58,
+    0x5A,
+    0x5C,
+    0x5E,
+    0x70,
+    0x78,
+    0x7A,
+    0x7C,
+    0x7E,
+)
+
+
+class _ADCSnapshot:
+    """Context manager returned by :py:meth:`AXP192.snapshot`"""
+
+    # pylint: disable=protected-access
+    def __init__(self, axp192: "AXP192"):
+        self._axp192 = axp192
+
+    def __enter__(self) -> "AXP192":
+        self._axp192._adc_burst = self._axp192._read_adc_burst()
+        return self._axp192
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._axp192._adc_burst = None
+
 
 # pylint: disable=no-self-use
 # pylint: disable=too-many-public-methods
+# pylint: disable=too-many-instance-attributes
 class AXP192:
     """Circuitpython driver for AXP192 power management IC
 
@@ -122,10 +209,87 @@ class AXP192:
 
         is_battery_connected = pmic.is_battery_connected
         battery_voltage = pmic.battery_voltage
+
+    Control registers are cached after the first read and updated on every write made by
+    the driver, so most control operations don't need to read back the device. If a
+    register is modified outside of this driver call :py:meth:`invalidate_cache` or
+    :py:meth:`refresh`
+
+    AXP192 supports I2C Fast-mode. Every property reads or writes the device over I2C,
+    running the bus at 400kHz instead of the common 100kHz default makes all of them
+    about four times faster. Pass a bus created with :py:meth:`create_i2c` or with
+    ``busio.I2C(board.SCL, board.SDA, frequency=400000)``
     """
 
     def __init__(self, i2c: busio.I2C, device_address: int = 0x34):
         self._device = I2CDevice(i2c, device_address)
+        self._register_cache = {}
+        self._adc_burst = None
+        # I2C buffers are shared by all the transactions, the device lock serializes them
+        self._out1 = bytearray(1)
+        self._out2 = bytearray(2)
+        self._out8 = bytearray(8)
+        self._in1 = bytearray(1)
+        self._in2 = bytearray(2)
+        self._in3 = bytearray(3)
+        self._in4 = bytearray(4)
+
+    @staticmethod
+    def create_i2c(
+        scl: microcontroller.Pin,
+        sda: microcontroller.Pin,
+        frequency: int = 400000,
+    ) -> busio.I2C:
+        """
+        Create an I2C bus running at AXP192 maximum speed
+
+        Pass the returned bus to the driver, or subclass, constructor
+
+        :param ~microcontroller.Pin scl: The I2C bus clock pin
+        :param ~microcontroller.Pin sda: The I2C bus data pin
+        :param int frequency: The I2C bus frequency in Hz. Default to 400kHz,
+            the maximum supported by AXP192
+        :returns: The I2C bus
+        """
+        return busio.I2C(scl, sda, frequency=frequency)
+
+    def invalidate_cache(self, register: int = None) -> None:
+        """
+        Discard the cached value of a control register
+
+        Next read of the register will be done on the device
+
+        :param int register: Register number to discard. Default to None: discard all registers
+        """
+        if register is None:
+            self._register_cache.clear()
+        else:
+            self._register_cache.pop(register, None)
+
+    def refresh(self, register: int) -> int:
+        """
+        Read a register from the device and update its cached value
+
+        :param int register: Register number. Allowed range: 0-255
+        :returns: The register value
+        """
+        self.invalidate_cache(register)
+        return self._read_register8(register)
+
+    def snapshot(self) -> _ADCSnapshot:
+        """
+        Read ACIN, VBUS and internal temperature ADCs in a single I2C transaction
+
+        Inside the ``with`` block :py:attr:`acin_voltage`, :py:attr:`acin_current`,
+        :py:attr:`vbus_voltage`, :py:attr:`vbus_current` and :py:attr:`internal_temperature`
+        return the values sampled when the block was entered
+
+        .. code-block:: python
+
+            with pmic.snapshot():
+                vbus_power = pmic.vbus_voltage * pmic.vbus_current
+        """
+        return _ADCSnapshot(self)
 
     @property
     def is_acin_present(self) -> bool:
@@ -139,7 +303,7 @@ class AXP192:
 
         In order to be able to read this voltage ADCs must be enable via :py:attr:`all_adc_enabled`
         """
-        return 1.7 * self._read_register12(0x56) / 1000.0
+        return 0.0017 * self.__read_adc_register12(0x56)
 
     @property
     def acin_current(self) -> float:
@@ -147,7 +311,7 @@ class AXP192:
 
         In order to be able to read this current ADCs must be enable via :py:attr:`all_adc_enabled`
         """
-        return 0.625 * self._read_register12(0x58)
+        return 0.625 * self.__read_adc_register12(0x58)
 
     @property
     def is_vbus_present(self) -> bool:
@@ -161,7 +325,7 @@ class AXP192:
 
         In order to be able to read this voltage ADCs must be enable via :py:attr:`all_adc_enabled`
         """
-        return 1.7 * self._read_register12(0x5A) / 1000.0
+        return 0.0017 * self.__read_adc_register12(0x5A)
 
     @property
     def vbus_current(self) -> float:
@@ -169,7 +333,7 @@ class AXP192:
 
         In order to be able to read this current ADCs must be enable via :py:attr:`all_adc_enabled`
         """
-        return 0.375 * self._read_register12(0x5C)
+        return 0.375 * self.__read_adc_register12(0x5C)
 
     @property
     def aps_voltage(self) -> float:
@@ -177,7 +341,7 @@ class AXP192:
 
         In order to be able to read this voltage ADCs must be enable via :py:attr:`all_adc_enabled`
         """
-        return 1.4 * self._read_register12(0x7E) / 1000.0
+        return 0.0014 * self._read_register12(0x7E)
 
     @property
     def is_battery_connected(self) -> bool:
@@ -199,17 +363,14 @@ class AXP192:
 
     @battery_charging_enabled.setter
     def battery_charging_enabled(self, enabled: bool) -> None:
-        if isinstance(enabled, bool):
-            if enabled:
-                self._set_bit_in_register(
-                    _AXP192_CHARGING_CTRL1, _AXP192_CHARGING_CTRL1_ENABLE
-                )
-            else:
-                self._clear_bit_in_register(
-                    _AXP192_CHARGING_CTRL1, _AXP192_CHARGING_CTRL1_ENABLE
-                )
+        if enabled:
+            self._set_bit_in_register(
+                _AXP192_CHARGING_CTRL1, _AXP192_CHARGING_CTRL1_ENABLE
+            )
         else:
-            raise ValueError("Enabled must be a boolean")
+            self._clear_bit_in_register(
+                _AXP192_CHARGING_CTRL1, _AXP192_CHARGING_CTRL1_ENABLE
+            )
 
     @property
     def battery_voltage(self) -> float:
@@ -245,7 +406,7 @@ class AXP192:
         In order to be able to read this power ADCs must be enable via :py:attr:`all_adc_enabled`
         Return 0 if no battery is connected to AXP192
         """
-        return 1.1 * 0.5 * self._read_register24(0x70) / 1000
+        return 0.00055 * self._read_register24(0x70)
 
     @property
     def battery_level(self) -> float:
@@ -254,8 +415,11 @@ class AXP192:
         In order to be able to read this power ADCs must be enable via :py:attr:`all_adc_enabled`
         Return 0 if no battery is connected to AXP192
         """
-        bat_voltage = self.battery_voltage
-        bat_chg_current = self.battery_charge_current
+        # Battery voltage and charge current ADCs are contiguous, read both at once
+        adc_data = self._read_register_block(_AXP192_BATTERY_VOLTAGE_ADC, self._in4)
+        bat_voltage = 0.0011 * (adc_data[0] << 4 | adc_data[1])
+        bat_chg_current = 0.5 * (adc_data[2] << 4 | adc_data[3])
+        # Power off and charging target voltages come from the register cache
         vmin = self.battery_switch_off_voltage
         vmax = self.battery_charge_target_voltage
 
@@ -280,14 +444,7 @@ class AXP192:
         Voltage threshold for status: battery fully charged. For LiPo battery is 4.2V
         """
         reg_val = (self._read_register8(_AXP192_CHARGING_CTRL1) & 0x60) >> 5
-        if reg_val == 0:
-            return 4.1
-        if reg_val == 1:
-            return 4.15
-        if reg_val == 2:
-            return 4.2
-
-        return 4.36
+        return _AXP192_CHARGING_CTRL1_TARGET_VOLTAGES[reg_val]
 
     @property
     def all_adc_enabled(self) -> bool:
@@ -324,7 +481,7 @@ class AXP192:
     @property
     def internal_temperature(self) -> float:
         """Internal AXP192 temperature in Celsius degrees"""
-        return -144.7 + 0.1 * self._read_register12(0x5E)
+        return -144.7 + 0.1 * self.__read_adc_register12(0x5E)
 
     @property
     def power_key_was_pressed(self) -> Tuple[bool, bool]:
@@ -332,19 +489,53 @@ class AXP192:
 
         :returns: Two booleans: Power key is short press and power key is long press
         """
-        reg_val = self._read_register8(_AXP192_IRQ_3_STATUS)
+        reg_val = self._read_and_clear_irq3()
         short_press = (reg_val & _AXP192_IRQ_3_STATUS_PEK_SHORT_PRESS) != 0
         long_press = (reg_val & _AXP192_IRQ_3_STATUS_PEK_LONG_PRESS) != 0
-        # clear the readed interrupt events
-        if short_press or long_press:
-            reg_val = (
-                _AXP192_IRQ_3_STATUS_PEK_SHORT_PRESS
-                | _AXP192_IRQ_3_STATUS_PEK_LONG_PRESS
-            )
-            self._write_register8(_AXP192_IRQ_3_STATUS, reg_val)
 
         return (short_press, long_press)
 
+    @property
+    def power_key_irq_enabled(self) -> bool:
+        """Enable/disable the IRQ output signal on power key short and long press
+
+        AXP192 keeps the IRQ line active until the events are cleared by reading
+        :py:attr:`power_key_was_pressed`
+        """
+        reg_val = self._read_register8(_AXP192_IRQ_3_ENABLE)
+        return (reg_val & _AXP192_IRQ_3_ENABLE_PEK) == _AXP192_IRQ_3_ENABLE_PEK
+
+    @power_key_irq_enabled.setter
+    def power_key_irq_enabled(self, enabled: bool) -> None:
+        if enabled:
+            self._set_bit_in_register(_AXP192_IRQ_3_ENABLE, _AXP192_IRQ_3_ENABLE_PEK)
+        else:
+            self._clear_bit_in_register(_AXP192_IRQ_3_ENABLE, _AXP192_IRQ_3_ENABLE_PEK)
+
+    def clear_pending_irqs(self) -> bytearray:
+        """
+        Clear all the pending IRQ events so AXP192 releases the IRQ output line
+
+        Only the events returned are cleared, an event latched after the read stays
+        pending and keeps the IRQ line active. The returned buffer is shared with the
+        other 4 bytes reads, use it before the next read
+
+        :returns: IRQ status 1, 2, 3 and 4 registers value
+        """
+        irq_status = self._read_irq_registers()
+        out_buf = self._out8
+        out_buf[0] = _AXP192_IRQ_1_STATUS
+        out_buf[1] = irq_status[0]
+        out_buf[2] = _AXP192_IRQ_2_STATUS
+        out_buf[3] = irq_status[1]
+        out_buf[4] = _AXP192_IRQ_3_STATUS
+        out_buf[5] = irq_status[2]
+        out_buf[6] = _AXP192_IRQ_4_STATUS
+        out_buf[7] = irq_status[3]
+        self._write_registers8(8)
+
+        return irq_status
+
     def power_off(self) -> None:
         """Switch off the AXP192 and the connected devices"""
         self._set_bit_in_register(
@@ -362,9 +553,6 @@ class AXP192:
 
     @_exten.setter
     def _exten(self, value: bool) -> None:
-        if not isinstance(value, bool):
-            raise ValueError("value must be a boolean True or False")
-
         if value:
             self._set_bit_in_register(
                 _AXP192_DCDC13_LDO23_CTRL, _AXP192_DCDC13_LDO23_CTRL_EXTEN
@@ -413,34 +601,79 @@ class AXP192:
     def _dcdc3_setpoint(self, value) -> None:
         self.__write_dcdcx_setpoint(3, value)
 
+    @property
+    def _dcdc1_step(self) -> int:
+        """DCDC1 output setpoint as register step
+
+        Step range goes from 0 (0.7V) to 112 (3.5V) in 25mV steps, no float conversion
+        is involved. The output is disabled when the step is -1
+        """
+        return self.__read_dcdcx_step(1)
+
+    @_dcdc1_step.setter
+    def _dcdc1_step(self, step: int) -> None:
+        self.__write_dcdcx_step(1, step)
+
+    @property
+    def _dcdc2_step(self) -> int:
+        """DCDC2 output setpoint as register step
+
+        Step range goes from 0 (0.7V) to 63 (2.275V) in 25mV steps, no float conversion
+        is involved. The output is disabled when the step is -1
+        """
+        return self.__read_dcdcx_step(2)
+
+    @_dcdc2_step.setter
+    def _dcdc2_step(self, step: int) -> None:
+        self.__write_dcdcx_step(2, step)
+
+    @property
+    def _dcdc3_step(self) -> int:
+        """DCDC3 output setpoint as register step
+
+        Step range goes from 0 (0.7V) to 112 (3.5V) in 25mV steps, no float conversion
+        is involved. The output is disabled when the step is -1
+        """
+        return self.__read_dcdcx_step(3)
+
+    @_dcdc3_step.setter
+    def _dcdc3_step(self, step: int) -> None:
+        self.__write_dcdcx_step(3, step)
+
     def __read_dcdcx_setpoint(self, num: int) -> float:
-        enable_bit, voltage_reg, max_value = self.__get_dcdcx_registers(num)
-        if (self._read_register8(_AXP192_DCDC13_LDO23_CTRL) & enable_bit) == 0:
+        reg_val = self.__read_dcdcx_step(num)
+        if reg_val < 0:
             return 0
 
-        return ((self._read_register8(voltage_reg) & max_value) * 25 + 700) / 1000
+        return (reg_val * 25 + 700) / 1000
 
     def __write_dcdcx_setpoint(self, num: int, voltage: int) -> None:
-        enable_bit, voltage_reg, max_value = self.__get_dcdcx_registers(num)
         voltage -= 0.7
         if voltage <= 0:
-            self._clear_bit_in_register(_AXP192_DCDC13_LDO23_CTRL, enable_bit)
+            self.__write_dcdcx_step(num, -1)
         else:
-            reg_value = int(voltage * 1000) // 25
-            reg_value = min(reg_value, max_value)
+            self.__write_dcdcx_step(num, int(voltage * 1000) // 25)
+
+    def __read_dcdcx_step(self, num: int) -> int:
+        enable_bit, voltage_reg, max_value = self.__get_dcdcx_registers(num)
+        if (self._read_register8(_AXP192_DCDC13_LDO23_CTRL) & enable_bit) == 0:
+            return -1
+
+        return self._read_register8(voltage_reg) & max_value
 
-            self._write_register8(voltage_reg, reg_value)
+    def __write_dcdcx_step(self, num: int, step: int) -> None:
+        enable_bit, voltage_reg, max_value = self.__get_dcdcx_registers(num)
+        if step < 0:
+            self._clear_bit_in_register(_AXP192_DCDC13_LDO23_CTRL, enable_bit)
+        else:
+            self._write_register8(voltage_reg, min(step, max_value))
             self._set_bit_in_register(_AXP192_DCDC13_LDO23_CTRL, enable_bit)
 
     def __get_dcdcx_registers(self, num: int) -> Tuple[int, int, int]:
-        if num == 1:
-            return (_AXP192_DCDC13_LDO23_CTRL_DCDC1, _AXP192_DCDC1_OUT_VOLTAGE, 0x7F)
-        if num == 2:
-            return (_AXP192_DCDC13_LDO23_CTRL_DCDC2, _AXP192_DCDC2_OUT_VOLTAGE, 0x3F)
-        if num == 3:
-            return (_AXP192_DCDC13_LDO23_CTRL_DCDC3, _AXP192_DCDC3_OUT_VOLTAGE, 0x7F)
-
-        raise ValueError("num must be 1, 2 or 3")
+        try:
+            return _AXP192_DCDCX_REGISTERS[num]
+        except (KeyError, TypeError):
+            raise ValueError("num must be 1, 2 or 3") from None
 
     @property
     def _backup_battery_charging_enable(self) -> bool:
@@ -452,17 +685,14 @@ class AXP192:
 
     @_backup_battery_charging_enable.setter
     def _backup_battery_charging_enable(self, value: bool) -> None:
-        if isinstance(value, bool):
-            if value:
-                self._set_bit_in_register(
-                    _AXP192_BACKUP_BATT, _AXP192_BACKUP_BATT_CHARGING_ENABLE
-                )
-            else:
-                self._clear_bit_in_register(
-                    _AXP192_BACKUP_BATT, _AXP192_BACKUP_BATT_CHARGING_ENABLE
-                )
+        if value:
+            self._set_bit_in_register(
+                _AXP192_BACKUP_BATT, _AXP192_BACKUP_BATT_CHARGING_ENABLE
+            )
         else:
-            raise ValueError("value must be a boolean True or False")
+            self._clear_bit_in_register(
+                _AXP192_BACKUP_BATT, _AXP192_BACKUP_BATT_CHARGING_ENABLE
+            )
 
     @property
     def _ldo2_setpoint(self) -> float:
@@ -490,37 +720,69 @@ class AXP192:
     def _ldo3_setpoint(self, value) -> None:
         self.__write_ldo23_setpoint(3, value)
 
+    @property
+    def _ldo2_step(self) -> int:
+        """LDO2 output setpoint as register step
+
+        Step range goes from 0 (1.8V) to 15 (3.3V) in 100mV steps, no float conversion
+        is involved. The output is disabled when the step is -1
+        """
+        return self.__read_ldo23_step(2)
+
+    @_ldo2_step.setter
+    def _ldo2_step(self, step: int) -> None:
+        self.__write_ldo23_step(2, step)
+
+    @property
+    def _ldo3_step(self) -> int:
+        """LDO3 output setpoint as register step
+
+        Step range goes from 0 (1.8V) to 15 (3.3V) in 100mV steps, no float conversion
+        is involved. The output is disabled when the step is -1
+        """
+        return self.__read_ldo23_step(3)
+
+    @_ldo3_step.setter
+    def _ldo3_step(self, step: int) -> None:
+        self.__write_ldo23_step(3, step)
+
     def __read_ldo23_setpoint(self, num: int) -> float:
-        enable_bit, value_offset = self.__get_ldo23_registers(num)
-        if (self._read_register8(_AXP192_DCDC13_LDO23_CTRL) & enable_bit) == 0:
+        reg_val = self.__read_ldo23_step(num)
+        if reg_val < 0:
             return 0
 
-        reg_val = (
-            self._read_register8(_AXP192_LDO23_OUT_VOLTAGE) >> value_offset
-        ) & 0xF
         return (reg_val * 100 + 1800) / 1000
 
     def __write_ldo23_setpoint(self, num: int, voltage: float) -> float:
-        enable_bit, value_offset = self.__get_ldo23_registers(num)
         voltage -= 1.8
         if voltage < 0:
+            self.__write_ldo23_step(num, -1)
+        else:
+            # voltage * 10 = voltage * 1000 / 100
+            self.__write_ldo23_step(num, min(0x0F, int(voltage * 10)))
+
+    def __read_ldo23_step(self, num: int) -> int:
+        enable_bit, value_offset, _ = self.__get_ldo23_registers(num)
+        if (self._read_register8(_AXP192_DCDC13_LDO23_CTRL) & enable_bit) == 0:
+            return -1
+
+        return (self._read_register8(_AXP192_LDO23_OUT_VOLTAGE) >> value_offset) & 0xF
+
+    def __write_ldo23_step(self, num: int, step: int) -> None:
+        enable_bit, value_offset, keep_mask = self.__get_ldo23_registers(num)
+        if step < 0:
             self._clear_bit_in_register(_AXP192_DCDC13_LDO23_CTRL, enable_bit)
         else:
-            reg_val = int(voltage * 10)  # voltage * 10 = voltage * 1000 / 100
-            reg_val = min(0x0F, reg_val)
-            reg_val = reg_val << value_offset
-            mask = ~(0x0F << value_offset)
-            reg_val = (self._read_register8(_AXP192_LDO23_OUT_VOLTAGE) & mask) | reg_val
+            reg_val = min(0x0F, step) << value_offset
+            reg_val |= self._read_register8(_AXP192_LDO23_OUT_VOLTAGE) & keep_mask
             self._write_register8(_AXP192_LDO23_OUT_VOLTAGE, reg_val)
             self._set_bit_in_register(_AXP192_DCDC13_LDO23_CTRL, enable_bit)
 
-    def __get_ldo23_registers(self, num: int) -> Tuple[int, int]:
-        if num == 2:
-            return (_AXP192_DCDC13_LDO23_CTRL_LDO2, 4)
-        if num == 3:
-            return (_AXP192_DCDC13_LDO23_CTRL_LDO3, 0)
-
-        raise ValueError("num must be 2 or 3")
+    def __get_ldo23_registers(self, num: int) -> Tuple[int, int, int]:
+        try:
+            return _AXP192_LDO23_REGISTERS[num]
+        except (KeyError, TypeError):
+            raise ValueError("num must be 2 or 3") from None
 
     def _set_gpio_floating(self, gpio_num: int) -> None:
         """
@@ -528,9 +790,8 @@ class AXP192:
 
         :param int gpio_num: Number of the GPIO to set as floating pin. Allowed values: 0, 1 or 2
         """
-        self.__validate_gpio_num(gpio_num)
-        if 0 <= gpio_num <= 2:
-            self.__set_gpio_function(gpio_num, 0x7)
+        if isinstance(gpio_num, int) and gpio_num in _AXP192_GPIOS_WITH_FLOATING_MODE:
+            self.__set_gpio_function(gpio_num, _AXP192_GPIO_FUNCTION_FLOATING)
         else:
             raise ValueError(f"GPIO{gpio_num} doesn't support floating mode")
 
@@ -541,9 +802,10 @@ class AXP192:
         :param int gpio_num: Number of the GPIO to check. Allowed values: 0, 1 or 2
         :returns: True is the GPIO is in floating pin mode
         """
-        self.__validate_gpio_num(gpio_num)
-        if 0 <= gpio_num <= 2:
-            return (self.__get_gpio_function(gpio_num) & 0x06) == 0x06
+        if isinstance(gpio_num, int) and gpio_num in _AXP192_GPIOS_WITH_FLOATING_MODE:
+            return (
+                self.__get_gpio_function(gpio_num) & _AXP192_GPIO_FUNCTION_FLOATING_MASK
+            ) == _AXP192_GPIO_FUNCTION_FLOATING_MASK
 
         raise ValueError(f"GPIO{gpio_num} doesn't support floating mode")
 
@@ -554,9 +816,8 @@ class AXP192:
 
         :param int gpio_num: Number of the GPIO to set as output low. Allowed values: 0, 1 or 2
         """
-        self.__validate_gpio_num(gpio_num)
-        if 0 <= gpio_num <= 2:
-            self.__set_gpio_function(gpio_num, 0x5)
+        if isinstance(gpio_num, int) and gpio_num in _AXP192_GPIOS_WITH_LOW_OUTPUT_MODE:
+            self.__set_gpio_function(gpio_num, _AXP192_GPIO_FUNCTION_OUTPUT_LOW)
         else:
             raise ValueError(f"GPIO{gpio_num} doesn't support low output mode")
 
@@ -566,9 +827,10 @@ class AXP192:
         :param int gpio_num: Number of the GPIO to check. Allowed values: 0, 1 or 2
         :returns: True is the GPIO is in low output mode
         """
-        self.__validate_gpio_num(gpio_num)
-        if 0 <= gpio_num <= 2:
-            return self.__get_gpio_function(gpio_num) == 0x05
+        if isinstance(gpio_num, int) and gpio_num in _AXP192_GPIOS_WITH_LOW_OUTPUT_MODE:
+            return (
+                self.__get_gpio_function(gpio_num) == _AXP192_GPIO_FUNCTION_OUTPUT_LOW
+            )
 
         raise ValueError(f"GPIO{gpio_num} doesn't support low output mode")
 
@@ -580,19 +842,20 @@ class AXP192:
         :param int gpio_num: Number of the GPIO to set as LDO voltage output. Allowed value: 0
         :param float voltage: LDO output voltage in V. Output range: 1.8-3.3V in 0.1V steps
         """
-        self.__validate_gpio_num(gpio_num)
-        if gpio_num == 0:
-            if isinstance(voltage, (int, float)):
-                voltage -= 1.8
-                if voltage <= 0:
-                    self._set_gpio_output_low(gpio_num)
-                else:
-                    reg_val = int(voltage / 0.1)
-                    reg_val = min(0x0F, reg_val)
-                    self._write_register8(_AXP192_GPIO0_LDO_VOLTAGE, reg_val << 4)
-                    self.__set_gpio_function(gpio_num, 0x2)
+        if isinstance(gpio_num, int) and gpio_num in _AXP192_GPIOS_WITH_LDO_MODE:
+            voltage -= 1.8
+            if voltage <= 0:
+                self._set_gpio_output_low(gpio_num)
             else:
-                raise ValueError("Voltage must be a number")
+                reg_val = int(voltage / 0.1)
+                reg_val = min(0x0F, reg_val)
+                # Set the voltage and the LDO function
+                out_buf = self._out8
+                out_buf[0] = _AXP192_GPIO0_LDO_VOLTAGE
+                out_buf[1] = reg_val << 4
+                out_buf[2] = _AXP192_GPIO0_FUNCTION
+                out_buf[3] = _AXP192_GPIO_FUNCTION_LDO
+                self._write_registers8(4)
         else:
             raise ValueError(f"GPIO{gpio_num} doesn't support LDO voltage mode")
 
@@ -607,11 +870,8 @@ class AXP192:
         if not self._is_gpio_ldo_voltage_out(gpio_num):
             return 0
 
-        if gpio_num == 0:
-            reg_value = self._read_register8(_AXP192_GPIO0_LDO_VOLTAGE) >> 4
-            return reg_value * 0.1 + 1.8
-
-        raise ValueError(f"GPIO{gpio_num} doesn't support LDO voltage mode")
+        reg_value = self._read_register8(_AXP192_GPIO0_LDO_VOLTAGE) >> 4
+        return reg_value * 0.1 + 1.8
 
     def _is_gpio_ldo_voltage_out(self, gpio_num: int) -> bool:
         """
@@ -620,9 +880,8 @@ class AXP192:
         :param int gpio_num: Number of the GPIO to check. Allowed value: 0
         :returns: True when GPIO is in LDO voltage output mode
         """
-        self.__validate_gpio_num(gpio_num)
-        if gpio_num == 0:
-            return self.__get_gpio_function(gpio_num) == 0x02
+        if isinstance(gpio_num, int) and gpio_num in _AXP192_GPIOS_WITH_LDO_MODE:
+            return self.__get_gpio_function(gpio_num) == _AXP192_GPIO_FUNCTION_LDO
 
         raise ValueError(f"GPIO{gpio_num} doesn't support LDO voltage mode")
 
@@ -630,26 +889,36 @@ class AXP192:
         """
         Set the GPIO as a PWM output
         PWM Output voltage is VINT (2.5V)
+        When the GPIO is already outputting the requested duty cycle no I2C write is done
 
         :param int gpio_num: Number of the GPIO to set as PWM output. Allowed values: 1 or 2
         :param int duty_cyle: PWM duty cycle. Range 0-255
         """
-        self.__validate_gpio_num(gpio_num)
-        if 1 <= gpio_num <= 2:
-            if isinstance(duty_cycle, int):
-                if 0 <= duty_cycle <= 255:
-                    pwm_reg = (
-                        _AXP192_PWM1_DUTY_RATIO_Y1
-                        if gpio_num == 1
-                        else _AXP192_PWM2_DUTY_RATIO_Y1
-                    )
-                    self._write_register8(pwm_reg, 0xFF)
-                    self._write_register8(pwm_reg + 1, duty_cycle)
-                    self.__set_gpio_function(gpio_num, 0x02)
-                else:
-                    raise ValueError("Duty cycle out of range. Allowed range 0-255")
+        if isinstance(gpio_num, int) and gpio_num in _AXP192_GPIOS_WITH_PWM_MODE:
+            if 0 <= duty_cycle <= 255:
+                pwm_reg = (
+                    _AXP192_PWM1_DUTY_RATIO_Y1
+                    if gpio_num == 1
+                    else _AXP192_PWM2_DUTY_RATIO_Y1
+                )
+                function_reg = _AXP192_GPIO_FUNCTIONS[gpio_num][0]
+                cache = self._register_cache
+                if (
+                    cache.get(pwm_reg + 1) != duty_cycle
+                    or cache.get(pwm_reg) != 0xFF
+                    or cache.get(function_reg) != _AXP192_GPIO_FUNCTION_PWM
+                ):
+                    # Set PWM X, PWM Y1 and the PWM function
+                    out_buf = self._out8
+                    out_buf[0] = pwm_reg
+                    out_buf[1] = 0xFF
+                    out_buf[2] = pwm_reg + 1
+                    out_buf[3] = duty_cycle
+                    out_buf[4] = function_reg
+                    out_buf[5] = _AXP192_GPIO_FUNCTION_PWM
+                    self._write_registers8(6)
             else:
-                raise ValueError("Duty cycle must be an integer number from 0 to 255")
+                raise ValueError("Duty cycle out of range. Allowed range 0-255")
         else:
             raise ValueError(f"GPIO{gpio_num} doesn't PWM output mode")
 
@@ -660,8 +929,7 @@ class AXP192:
         :param int gpio_num: Number of the GPIO to check. Allowed values: 1, 2
         :returns: PWM duty_cyle in range 0-255. Returns 0 if the GPIO isn't in PWM output mode
         """
-        self.__validate_gpio_num(gpio_num)
-        if 1 <= gpio_num <= 2:
+        if isinstance(gpio_num, int) and gpio_num in _AXP192_GPIOS_WITH_PWM_MODE:
             if self._is_gpio_pwm_out(gpio_num):
                 pwm_reg = (
                     _AXP192_PWM1_DUTY_RATIO_Y1
@@ -678,99 +946,196 @@ class AXP192:
         :param int gpio_num: Number of the GPIO to check. Allowed values: 1, 2
         :returns: True when GPIO is in PWM output mode
         """
-        self.__validate_gpio_num(gpio_num)
-        if 1 <= gpio_num <= 2:
-            return self.__get_gpio_function(gpio_num) == 0x02
+        if isinstance(gpio_num, int) and gpio_num in _AXP192_GPIOS_WITH_PWM_MODE:
+            return self.__get_gpio_function(gpio_num) == _AXP192_GPIO_FUNCTION_PWM
 
         raise ValueError(f"GPIO{gpio_num} doesn't PWM output mode")
 
-    def __validate_gpio_num(self, gpio_num: int) -> None:
-        if not isinstance(gpio_num, int) or gpio_num < 0 or gpio_num > 4:
-            raise ValueError("gpio_num must be an integer number between 0 and 4")
-
     def __set_gpio_function(self, gpio_num: int, function: int) -> None:
-        if gpio_num == 0:
-            self._write_register8(_AXP192_GPIO0_FUNCTION, function & 0x07)
-        elif gpio_num == 1:
-            self._write_register8(_AXP192_GPIO1_FUNCTION, function & 0x07)
-        elif gpio_num == 2:
-            self._write_register8(_AXP192_GPIO2_FUNCTION, function & 0x07)
-        elif gpio_num == 3:
-            reg_val = self._read_register8(_AXP192_GPIO34_FUNCTION)
-            reg_val &= ~0x03
-            reg_val |= function & 0x03
-            self._write_register8(_AXP192_GPIO34_FUNCTION, reg_val)
-        elif gpio_num == 4:
-            reg_val = self._read_register8(_AXP192_GPIO34_FUNCTION)
-            reg_val &= ~0x0C
-            reg_val |= (function & 0x03) << 2
-            self._write_register8(_AXP192_GPIO34_FUNCTION, reg_val)
+        register, offset, mask = _AXP192_GPIO_FUNCTIONS[gpio_num]
+        function &= mask
+        if offset == 0 and mask == 0x07:
+            # GPIO0-2 have a dedicated function register
+            self._write_register8(register, function)
         else:
-            raise ValueError("gpio_num must be in range 0-4")
+            self._update_bits_in_register(register, mask << offset, function << offset)
 
     def __get_gpio_function(self, gpio_num: int) -> int:
-        if gpio_num == 0:
-            return self._read_register8(_AXP192_GPIO0_FUNCTION) & 0x07
-        if gpio_num == 1:
-            return self._read_register8(_AXP192_GPIO1_FUNCTION) & 0x07
-        if gpio_num == 2:
-            return self._read_register8(_AXP192_GPIO2_FUNCTION) & 0x07
-        if gpio_num == 3:
-            return self._read_register8(_AXP192_GPIO34_FUNCTION) & 0x03
-        if gpio_num == 4:
-            return (self._read_register8(_AXP192_GPIO34_FUNCTION) >> 2) & 0x03
-
-        raise ValueError("gpio_num must be in range 0-4")
+        register, offset, mask = _AXP192_GPIO_FUNCTIONS[gpio_num]
+        return (self._read_register8(register) >> offset) & mask
+
+    def _read_irq_registers(self) -> bytearray:
+        """
+        Read all the IRQ status registers (0x44-0x47) in a single I2C transaction
+
+        The returned buffer is shared with the other 4 bytes reads, use it before the next read
+
+        :returns: IRQ status 1, 2, 3 and 4 registers value
+        """
+        return self._read_register_block(_AXP192_IRQ_1_STATUS, self._in4)
+
+    def _read_and_clear_irq3(self) -> int:
+        """
+        Read IRQ status 3 register and clear the power key events found set
+
+        Read and clear are done in a single I2C bus lock, the clear write is
+        skipped when no power key event is pending
+
+        :returns: IRQ status 3 register value
+        """
+        out_buf = self._out1
+        in_buf = self._in1
+        device = self._device
+
+        out_buf[0] = _AXP192_IRQ_3_STATUS
+        with device:
+            device.write_then_readinto(out_buf, in_buf)
+            flags = in_buf[0]
+            # clear only the readed interrupt events
+            events = flags & (
+                _AXP192_IRQ_3_STATUS_PEK_SHORT_PRESS
+                | _AXP192_IRQ_3_STATUS_PEK_LONG_PRESS
+            )
+            if events:
+                clear_buf = self._out2
+                clear_buf[0] = _AXP192_IRQ_3_STATUS
+                clear_buf[1] = events
+                device.write(clear_buf)
+
+        return flags
+
+    def _read_adc_burst(self) -> bytearray:
+        """
+        Read ACIN, VBUS and internal temperature ADC registers (0x56-0x5F)
+
+        :returns: The registers value
+        """
+        return self._read_register_block(
+            _AXP192_ACIN_VOLTAGE_ADC, bytearray(_AXP192_ADC_BURST_LENGTH)
+        )
+
+    def __read_adc_register12(self, register: int) -> int:
+        burst = self._adc_burst
+        if burst is not None:
+            offset = register - _AXP192_ACIN_VOLTAGE_ADC
+            return burst[offset] << 4 | burst[offset + 1]
+
+        return self._read_register12(register)
 
     def _set_bit_in_register(self, register: int, bitmask: int) -> None:
         """
         Set a single or multiple bits in a 8 bit register
 
+        When the register is cached only the write transaction is done
+
         :param int register: Register number. Allowed range: 0-255
         :param int bitmask: Bitmask 8 bit wide with the bits to set
         """
-        val = self._read_register8(register)
+        val = self._register_cache.get(register)
+        if val is None:
+            val = self._read_register8(register)
         self._write_register8(register, val | bitmask)
 
     def _clear_bit_in_register(self, register: int, bitmask: int) -> None:
         """
         Clear a single or multiple bits in a 8 bit register
 
+        When the register is cached only the write transaction is done
+
         :param int register: Register number. Allowed range: 0-255
         :param int bitmask: Bitmask 8 bit wide with the bits to clear
         """
-        val = self._read_register8(register)
+        val = self._register_cache.get(register)
+        if val is None:
+            val = self._read_register8(register)
         self._write_register8(register, val & ~bitmask)
 
+    def _update_bits_in_register(self, register: int, bitmask: int, value: int) -> None:
+        """
+        Replace a group of bits in a 8 bit register with a single read-modify-write
+
+        When the register is cached only the write transaction is done
+
+        :param int register: Register number. Allowed range: 0-255
+        :param int bitmask: Bitmask 8 bit wide with the bits to replace
+        :param int value: New value of the bits selected by bitmask
+        """
+        val = self._register_cache.get(register)
+        if val is None:
+            val = self._read_register8(register)
+        self._write_register8(register, (val & ~bitmask) | (value & bitmask))
+
     def _write_register8(self, register: int, value: int) -> None:
         """
         Write an AXP192 8bit register
 
+        The register cache is updated only after a successful write, so it never
+        holds a value the device didn't receive
+
         :param int register: Register number. Allowed range: 0-255
         :param int value: Value to write: Allowed range: 0x0 - 0xFF
         """
-        out_buf = bytearray(2)
+        out_buf = self._out2
+        device = self._device
 
         out_buf[0] = register
         out_buf[1] = value
-        with self._device:
-            self._device.write(out_buf)
+        with device:
+            device.write(out_buf)
+
+        if register not in _AXP192_VOLATILE_REGISTERS:
+            self._register_cache[register] = value
+
+    def _write_registers8(self, length: int) -> None:
+        """
+        Write up to four AXP192 8bit registers in a single I2C transaction
+
+        AXP192 multiple bytes write sends each register number followed by its value,
+        registers don't need to be consecutive. The caller fills ``self._out8`` with
+        the register number and value pairs: ``register0, value0, register1, value1, ...``
+
+        :param int length: Number of bytes to write from ``self._out8``. Allowed values:
+            2, 4, 6 and 8
+        """
+        out_buf = self._out8
+        device = self._device
+
+        with device:
+            device.write(out_buf, end=length)
+
+        cache = self._register_cache
+        for i in range(0, length, 2):
+            register = out_buf[i]
+            if register not in _AXP192_VOLATILE_REGISTERS:
+                cache[register] = out_buf[i + 1]
 
     def _read_register8(self, register: int) -> int:
         """
         Read an AXP192 8bit register
 
+        Control registers are returned from the register cache when available
+
         :param int register: Register number. Allowed range: 0-255
         :returns: The register value
         """
-        in_buf = bytearray(1)
-        out_buf = bytearray(1)
+        cache = self._register_cache
+        value = cache.get(register)
+        if value is not None:
+            return value
+
+        in_buf = self._in1
+        out_buf = self._out1
+        device = self._device
 
         out_buf[0] = register
-        with self._device:
-            self._device.write_then_readinto(out_buf, in_buf)
+        with device:
+            device.write_then_readinto(out_buf, in_buf)
+
+        value = in_buf[0]
+        if register not in _AXP192_VOLATILE_REGISTERS:
+            cache[register] = value
 
-        return in_buf[0]
+        return value
 
     def _read_register12(self, register: int) -> int:
         """
@@ -779,12 +1144,13 @@ class AXP192:
         :param int register: Register number. Allowed range: 0-255
         :returns: The register value
         """
-        in_buf = bytearray(2)
-        out_buf = bytearray(1)
+        in_buf = self._in2
+        out_buf = self._out1
+        device = self._device
 
         out_buf[0] = register
-        with self._device:
-            self._device.write_then_readinto(out_buf, in_buf)
+        with device:
+            device.write_then_readinto(out_buf, in_buf)
 
         return in_buf[0] << 4 | in_buf[1]
 
@@ -795,11 +1161,30 @@ class AXP192:
         :param int register: Register number. Allowed range: 0-255
         :returns: The register value
         """
-        in_buf = bytearray(3)
-        out_buf = bytearray(1)
+        in_buf = self._in3
+        out_buf = self._out1
+        device = self._device
 
         out_buf[0] = register
-        with self._device:
-            self._device.write_then_readinto(out_buf, in_buf)
+        with device:
+            device.write_then_readinto(out_buf, in_buf)
 
         return in_buf[0] << 16 | in_buf[1] << 8 | in_buf[2]
+
+    def _read_register_block(self, register: int, in_buf: bytearray) -> bytearray:
+        """
+        Read a block of consecutive AXP192 registers in a single I2C transaction
+
+        :param int register: First register number. Allowed range: 0-255
+        :param bytearray in_buf: Buffer filled with the registers value.
+            Its length is the number of registers to read
+        :returns: The buffer passed as ``in_buf``
+        """
+        out_buf = self._out1
+        device = self._device
+
+        out_buf[0] = register
+        with device:
+            device.write_then_readinto(out_buf, in_buf)
+
+        return in_buf
@@ -4,15 +4,26 @@
 
 import time
 import board
+import busio
 from axp192 import AXP192
 
-__LCD_BRIGHTNESS_MIN_V = 2.45
-__LCD_BRIGHTNESS_MAX_V = 3.3
+# DCDC3 register steps of the LCD backlight range: 0.7V + 25mV per step
+_LCD_BRIGHTNESS_MIN_STEP = 70  # 2.45V
+_LCD_BRIGHTNESS_MAX_STEP = 104  # 3.3V
+_LCD_BRIGHTNESS_STEPS = _LCD_BRIGHTNESS_MAX_STEP - _LCD_BRIGHTNESS_MIN_STEP
+_LCD_BRIGHTNESS_INV_STEPS = 1.0 / _LCD_BRIGHTNESS_STEPS
+# LDO3 register step for each vibration motor strength: strength 15 is step 15 (3.3V)
+# and every strength less is 100mV less. Strength 0 (step -1) turns the motor off
+_VIBRATION_LDO3_STEP = (-1,) + tuple(range(1, 16))
 
 
 class PMIC(AXP192):
-    def __init__(self):
-        super().__init__(board.I2C())
+    def __init__(self, i2c: busio.I2C = None):
+        """
+        :param ~busio.I2C i2c: The I2C bus the AXP192 is connected to, when omitted
+            the board default I2C bus is used
+        """
+        super().__init__(i2c if i2c is not None else board.I2C())
 
     @property
     def speaker_enabled(self) -> bool:
@@ -47,45 +58,40 @@ class PMIC(AXP192):
 
         Streght range goes from 0 (motor off) to 15 (max intensity)
         """
-        volt = self._ldo3_setpoint
-        if volt == 0:
-            return 0
-
-        return round((self._ldo3_setpoint - 1.8) / 0.1)
+        # LDO3 disabled (step -1) or at 1.8V (step 0) means motor off
+        return max(0, self._ldo3_step)
 
     @vibration_motor_strength.setter
     def vibration_motor_strength(self, strength: int) -> None:
-        if isinstance(strength, int):
-            if strength <= 0:
-                self._ldo3_setpoint = 0
-            else:
-                strength = min(15, strength)
-                self._ldo3_setpoint = 1.8 + strength * 0.1
-        else:
+        if not isinstance(strength, int):
             raise ValueError("strengh must be an integer value in range 0-15")
 
+        self._ldo3_step = _VIBRATION_LDO3_STEP[min(15, max(0, strength))]
+
     @property
     def lcd_brightness(self) -> float:
         """LCD backlight brightness
 
         Brightness range goes from 0.0 (no backlight) to 1.0 (max brightness)
         """
-        volt = self._dcdc3_setpoint
-        if volt == 0:
+        step = self._dcdc3_step
+        if step < 0:
             return 0
 
-        dV = __LCD_BRIGHTNESS_MAX_V - __LCD_BRIGHTNESS_MIN_V
-        brightness = (volt - __LCD_BRIGHTNESS_MIN_V) / dV
+        brightness = (step - _LCD_BRIGHTNESS_MIN_STEP) * _LCD_BRIGHTNESS_INV_STEPS
         return max(0.0, brightness)
 
     @lcd_brightness.setter
     def lcd_brightness(self, brightness: float) -> None:
         if brightness < 0.1:
-            self._dcdc3_setpoint = 0
+            self._dcdc3_step = -1
         else:
+            # Program the DCDC3 step directly: a voltage would be floored to the step
+            # below and full brightness would never reach 3.3V
             brightness = min(1.0, brightness)
-            dV = __LCD_BRIGHTNESS_MAX_V - __LCD_BRIGHTNESS_MIN_V
-            self._dcdc3_setpoint = brightness * dV + __LCD_BRIGHTNESS_MIN_V
+            self._dcdc3_step = _LCD_BRIGHTNESS_MIN_STEP + round(
+                brightness * _LCD_BRIGHTNESS_STEPS
+            )
 
     @property
     def power_supply_from_m_bus_enabled(self) -> bool:
@@ -134,13 +140,44 @@ class PMIC(AXP192):
         self._exten = enabled
 
 
+def tick(deadline: int, period_ns: int) -> int:
+    """Wait for the next period deadline and return it
+
+    Sleep only for the time left to the deadline, so the time spent writing
+    on the I2C bus doesn't add up period after period. When the deadline is
+    already missed don't try to catch up: restart the schedule from now
+    """
+    deadline += period_ns
+    now = time.monotonic_ns()
+    if deadline <= now:
+        return now
+    time.sleep((deadline - now) / 1_000_000_000)
+    return deadline
+
+
+FADE_STEP_NS = 1_000_000  # 1ms
+# Green led PWM duty cycles for a brightness triangle wave: 0 up to 254 then
+# 255 down to 1. The led is active low so the duty cycle is 255 - brightness
+FADE_DUTY_RAMP = bytes(range(255, 0, -1)) + bytes(range(255))
+
+
+def fade_green_led(pmic_dev: PMIC) -> None:
+    """Fade the green led in and out forever"""
+    # FADE_DUTY_RAMP values are always in range 0-255, drive the PWM directly
+    # and skip the clamp done by green_led_brightness. Bind the method and the
+    # helpers to locals so the loop doesn't look them up at every step
+    set_pwm = pmic_dev._set_gpio_pwm_out  # pylint: disable=protected-access
+    ramp = FADE_DUTY_RAMP
+    wait = tick
+    step_ns = FADE_STEP_NS
+    next_step = time.monotonic_ns()
+    while True:
+        for duty in ramp:
+            set_pwm(1, duty)
+            next_step = wait(next_step, step_ns)
+
+
+# The board default I2C bus runs at 100kHz, to speed up every AXP192 transaction
+# pass a 400kHz bus: PMIC(AXP192.create_i2c(board.SCL, board.SDA))
 pmic = PMIC()
-
-while True:
-    for i in range(255):
-        pmic.green_led_brightness = i
-        time.sleep(0.001)
-
-    for i in range(255, 0, -1):
-        pmic.green_led_brightness = i
-        time.sleep(0.001)
+fade_green_led(pmic)
@@ -2,20 +2,40 @@
 #
 # SPDX-License-Identifier: MIT
 
-import time
+import alarm
 import board
 from axp192 import AXP192
 
+# SET THIS TO YOUR WIRING: the board pin connected to the AXP192 IRQ output,
+# for example board.D5. The IRQ output is active low
+IRQ_PIN = None
+
+if IRQ_PIN is None:
+    raise RuntimeError("Edit IRQ_PIN: set it to the pin wired to the AXP192 IRQ output")
+
+# Power key events in IRQ status 3 register (third byte of the IRQ status)
+IRQ_3_STATUS = 2
+PEK_SHORT_PRESS = 0b00000010
+PEK_LONG_PRESS = 0b00000001
+
 i2c = board.I2C()
 pmic = AXP192(i2c)
 
+# Signal power key presses on the IRQ line and start with no pending event
+pmic.power_key_irq_enabled = True
+pmic.clear_pending_irqs()
+
+irq_alarm = alarm.pin.PinAlarm(IRQ_PIN, value=False, pull=True)
+
 while True:
-    short_press, long_press = pmic.power_key_was_pressed
-    if short_press:
+    # Sleep until AXP192 signals an event, there is no need to poll it
+    alarm.light_sleep_until_alarms(irq_alarm)
+
+    # Read and clear all the pending events, also the ones not about the power key,
+    # so AXP192 releases the IRQ line. Decode the power key from the same read: an
+    # event latched after it stays pending and wakes up the board again
+    irq_status = pmic.clear_pending_irqs()
+    if irq_status[IRQ_3_STATUS] & PEK_SHORT_PRESS:
         print("Power key was short pressed")
-    elif long_press:
+    elif irq_status[IRQ_3_STATUS] & PEK_LONG_PRESS:
         print("Power key was long pressed")
-    else:
-        print("Power key isn't press")
-
-    time.sleep(1)
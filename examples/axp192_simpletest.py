@@ -9,11 +9,30 @@ from axp192 import AXP192
 i2c = board.I2C()
 pmic = AXP192(i2c)
 
+# Battery voltage changes slowly: while it stays the same double the polling
+# interval, up to 30 seconds, and go back to 1 second polling when it changes
+MIN_INTERVAL = 1.0
+MAX_INTERVAL = 30.0
+VOLTAGE_TOLERANCE = 0.01
+
+interval = MIN_INTERVAL
+last_voltage = -1.0  # Force the first print
 while True:
-    if pmic.is_battery_connected:
-        battery_voltage = pmic.battery_voltage
-        print(f"Battery voltage {battery_voltage}V")
+    battery_voltage = pmic.battery_voltage if pmic.is_battery_connected else None
+
+    if battery_voltage is None or last_voltage is None:
+        changed = battery_voltage is not last_voltage
+    else:
+        changed = abs(battery_voltage - last_voltage) >= VOLTAGE_TOLERANCE
+
+    if changed:
+        if battery_voltage is None:
+            print("No battery connected")
+        else:
+            print(f"Battery voltage {battery_voltage}V")
+        last_voltage = battery_voltage
+        interval = MIN_INTERVAL
     else:
-        print("No battery connected")
+        interval = min(MAX_INTERVAL, interval * 2)
 
-    time.sleep(1)
+    time.sleep(interval)
@@ -0,0 +1,128 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dario Cammi
+#
+# SPDX-License-Identifier: MIT
+"""
+`axp192_decode`
+================================================================================
+
+AXP192 ADC registers decoders for host side processing of captured register values
+
+
+* Author(s): Dario Cammi
+
+Implementation Notes
+--------------------
+
+This host side tool isn't part of the library: it isn't used by the :py:mod:`axp192`
+driver, it isn't packaged and it isn't meant to be copied on a CircuitPython board.
+It applies the same scaling used by the driver to raw register values captured from
+the I2C bus, for example to post-process battery logs on a PC.
+
+The scale factors are copied from the driver ADC properties in ``axp192.py``, when one
+of them changes there update it here too.
+
+When `Numba <https://numba.pydata.org>`_ is installed (``pip install numba``) the
+decoders are JIT compiled, otherwise they run as plain Python functions.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+
+    def njit(**_kwargs):
+        """Numba is not available: leave the decorated function untouched"""
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+@njit(cache=True)
+def decode_register12(high: int, low: int) -> int:
+    """
+    Decode a 12bit ADC value
+
+    :param int high: First ADC register value (8 MSB)
+    :param int low: Second ADC register value (4 LSB)
+    :returns: The ADC raw value
+    """
+    return high << 4 | low
+
+
+@njit(cache=True)
+def decode_acin_voltage(high: int, low: int) -> float:
+    """ACIN voltage in V from registers 0x56-0x57"""
+    return 0.0017 * (high << 4 | low)
+
+
+@njit(cache=True)
+def decode_acin_current(high: int, low: int) -> float:
+    """ACIN current in mA from registers 0x58-0x59"""
+    return 0.625 * (high << 4 | low)
+
+
+@njit(cache=True)
+def decode_vbus_voltage(high: int, low: int) -> float:
+    """VBUS voltage in V from registers 0x5A-0x5B"""
+    return 0.0017 * (high << 4 | low)
+
+
+@njit(cache=True)
+def decode_vbus_current(high: int, low: int) -> float:
+    """VBUS current in mA from registers 0x5C-0x5D"""
+    return 0.375 * (high << 4 | low)
+
+
+@njit(cache=True)
+def decode_internal_temperature(high: int, low: int) -> float:
+    """Internal AXP192 temperature in Celsius degrees from registers 0x5E-0x5F"""
+    return -144.7 + 0.1 * (high << 4 | low)
+
+
+@njit(cache=True)
+def decode_battery_output_power(high: int, mid: int, low: int) -> float:
+    """Battery istantaneous ouput power in mW from registers 0x70-0x72"""
+    return 0.00055 * (high << 16 | mid << 8 | low)
+
+
+@njit(cache=True)
+def decode_battery_voltage(high: int, low: int) -> float:
+    """Battery voltage in V from registers 0x78-0x79"""
+    return 0.0011 * (high << 4 | low)
+
+
+@njit(cache=True)
+def decode_charge_current(high: int, low: int) -> float:
+    """Battery charging current in mA from registers 0x7A-0x7B"""
+    return 0.5 * (high << 4 | low)
+
+
+@njit(cache=True)
+def decode_discharge_current(high: int, low: int) -> float:
+    """Battery discharging current in mA from registers 0x7C-0x7D"""
+    return 0.5 * (high << 4 | low)
+
+
+@njit(cache=True)
+def decode_aps_voltage(high: int, low: int) -> float:
+    """APS voltage in V from registers 0x7E-0x7F"""
+    return 0.0014 * (high << 4 | low)
+
+
+@njit(cache=True)
+def decode_battery_voltage_array(high, low, out):
+    """
+    Decode a sequence of battery voltage samples
+
+    The arguments can be lists or, when Numba is used, NumPy arrays
+
+    :param high: Register 0x78 samples
+    :param low: Register 0x79 samples
+    :param out: Output buffer, as long as ``high``, filled with the battery voltages in V
+    :returns: The ``out`` buffer
+    """
+    for i in range(len(high)):  # pylint: disable=consider-using-enumerate
+        out[i] = 0.0011 * (high[i] << 4 | low[i])
+
+    return out